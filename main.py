@@ -2,11 +2,17 @@
 import os
 import logging
 import re
-import time
+import asyncio
+import httpx
+import zipfile
 from RPA.Browser.Selenium import Selenium
-from RPA.Excel.Files import Files
-from urllib.parse import urlparse, parse_qs, unquote
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from urllib.parse import unquote
 from datetime import datetime
+from xml.sax.saxutils import escape
 
 
 class Config:
@@ -19,20 +25,56 @@ class Config:
     LOG_FILE = os.path.join(OUTPUT_DIR, 'scraper.log')
 
 # Ensure output directory exists
-if not os.path.exists(Config.OUTPUT_DIR):
-    os.makedirs(Config.OUTPUT_DIR)
-
-# Setup logging
-logging.basicConfig(
-    filename=Config.LOG_FILE,
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+os.makedirs(Config.OUTPUT_DIR, exist_ok=True)
+
+# Setup logging. delay=True defers opening the log file until the first record,
+# and per-article chatter is emitted at DEBUG so it skips formatting and I/O entirely.
+_log_handler = logging.FileHandler(Config.LOG_FILE, delay=True)
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+logging.getLogger().addHandler(_log_handler)
+logging.getLogger().setLevel(logging.INFO)
 logger = logging.getLogger('news_scraper')
 
+# Static parts of the .xlsx ZIP container; only the sheet XML varies per run.
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+_XLSX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+
+# Precompiled pattern matching any monetary value ($11.1, 11 dollars, 11 USD).
+# Compiling once at import time avoids repeated re-cache lookups on the hot path.
+_MONEY_RE = re.compile(r"\$\d[\d,]*\.?\d{0,2}|\d+\s+dollars|\d+\s+USD")
+
+# Extracts the encoded 'url=' query parameter from a promo image URL in one pass,
+# without allocating the ParseResult/dict that urlparse + parse_qs would.
+_IMG_URL_RE = re.compile(r'[?&]url=([^&]+)')
+
 # Set the logging level of external libraries to WARNING or ERROR
 logging.getLogger('RPA.Browser.Selenium').setLevel(logging.WARNING)
-logging.getLogger('RPA.Excel.Files').setLevel(logging.WARNING)
 logging.getLogger('urllib3').setLevel(logging.WARNING)
 
 class NewsScraper:
@@ -40,15 +82,25 @@ class NewsScraper:
     A scraper class to extract news articles from the LA Times website based on a search phrase.
     """
 
-    def __init__(self, search_phrase):
+    def __init__(self, search_phrases):
         """
-        Initializes the NewsScraper instance with a search phrase.
+        Initializes the NewsScraper instance with one or more search phrases.
 
         Args:
-            search_phrase (str): The phrase to search for on the LA Times website.
+            search_phrases (list[str] or str): The phrase(s) to search for on the LA Times website.
         """
         self.browser = Selenium()
-        self.search_phrase = search_phrase
+        self.search_phrases = [search_phrases] if isinstance(search_phrases, str) else list(search_phrases)
+        self.search_phrase = None
+        self._phrase_re = None
+        self.articles = []
+        # Keep-alive HTTP client so image downloads reuse TCP/TLS connections.
+        # HTTP/1.1 only: http2=True needs the httpx[http2] extra and buys little
+        # for sequential image GETs.
+        self._http = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=30.0
+        )
 
     def open_site(self):
         """
@@ -59,7 +111,15 @@ class NewsScraper:
         """
         logger.info(f"Opening site: {Config.SEARCH_URL}")
         try:
-            self.browser.open_available_browser(Config.SEARCH_URL)
+            # Headless mode with image loading disabled skips GPU paint and image decode;
+            # the image URL still comes from the src attribute in the DOM, so blocking the
+            # fetch itself is safe.
+            options = Options()
+            options.add_argument('--headless=new')
+            options.add_argument('--disable-gpu')
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+            self.browser.open_available_browser(Config.SEARCH_URL, options=options)
             logger.info("Site opened successfully.")
         except Exception as e:
             logger.error(f"Failed to open site: {e}")
@@ -74,9 +134,30 @@ class NewsScraper:
         """
         logger.info(f"Searching for news with phrase: '{self.search_phrase}'")
         try:
-            self.browser.click_element("css:button[data-element='search-button']") #The search button element.
-            self.browser.input_text("css:input[data-element='search-form-input']", self.search_phrase) # The search input field.
-            self.browser.press_keys("css:input[data-element='search-form-input']", "ENTER") # Prssing ENTER to search.
+            # On a warm session the previous search's results list is still in the DOM,
+            # so remember it and wait for it to go stale after submitting; otherwise the
+            # presence wait below would be satisfied by the old page mid-navigation.
+            old_results = self.browser.driver.find_elements(
+                By.CSS_SELECTOR, 'ul.search-results-module-results-menu li'
+            )
+            # Open the search form, set the phrase and submit in one injected JS call
+            # instead of three WebDriver hops with implicit waits. Overwriting the input
+            # value also clears any phrase left over from a previous search, so the warm
+            # session can be reused.
+            self.browser.driver.execute_script(
+                """
+                document.querySelector('button[data-element="search-button"]').click();
+                const i = document.querySelector('input[data-element="search-form-input"]');
+                i.value = arguments[0];
+                i.form.submit();
+                """,
+                self.search_phrase
+            )
+            if old_results:
+                WebDriverWait(self.browser.driver, 10).until(EC.staleness_of(old_results[0]))
+            WebDriverWait(self.browser.driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'ul.search-results-module-results-menu li'))
+            )
             logger.info("Search completed successfully.")
             self.progress_indicator(2, 3)
         except Exception as e:
@@ -92,15 +173,24 @@ class NewsScraper:
         """
         logger.info("Extracting the newest news article.")
         try:
-            # Extract article details
-            first_item = self.browser.find_element("css:ul.search-results-module-results-menu > li:first-child")
-            image_url = self.browser.get_element_attribute("css:img.image", "src")
-            title = self.browser.get_text("css:h3.promo-title a.link")
-            description = self.browser.get_text("css:p.promo-description")
-            date = self.browser.get_text("css:p.promo-timestamp")
+            # Scrape all fields with one injected JS snippet: a single WebDriver round trip
+            # returns the whole record, with no HTML shipped back for local parsing.
+            data = self.browser.driver.execute_script("""
+                const li = document.querySelector('ul.search-results-module-results-menu > li:first-child');
+                return {
+                    title: li.querySelector('h3.promo-title a.link').innerText,
+                    desc: li.querySelector('p.promo-description').innerText,
+                    date: li.querySelector('p.promo-timestamp').innerText,
+                    img: li.querySelector('img.image').src
+                };
+            """)
+            image_url = data["img"]
+            title = data["title"]
+            description = data["desc"]
+            date = data["date"]
 
             image_filename = self.download_image(image_url)
-            count_search_phrases = title.lower().count(self.search_phrase.lower()) + description.lower().count(self.search_phrase.lower())
+            count_search_phrases = len(self._phrase_re.findall(title)) + len(self._phrase_re.findall(description))
             contains_money = self.check_for_money(title, description)
 
             article = {
@@ -113,7 +203,7 @@ class NewsScraper:
             }
 
             logger.info("Article extracted successfully.")
-            self.save_to_excel([article])
+            self.articles.append(article)
             self.progress_indicator(3, 3)
         except Exception as e:
             logger.error(f"Error during extraction: {e}")
@@ -121,7 +211,7 @@ class NewsScraper:
 
     def download_image(self, url):
         """
-        Downloads the image from the provided URL using Selenium.
+        Downloads the image from the provided URL over HTTP.
 
         Args:
             url (str): The URL of the image to download.
@@ -129,18 +219,22 @@ class NewsScraper:
         Returns:
             str or None: The filename of the downloaded image, or None if download fails.
         """
-        logger.info(f"Attempting to download image from URL: {url}")
+        logger.debug(f"Attempting to download image from URL: {url}")
         try:
             if url:
-                parsed_url = urlparse(url)
-                query_params = parse_qs(parsed_url.query)
-                if 'url' in query_params:
-                    actual_image_url = unquote(query_params['url'][0])
-                    self.browser.go_to(actual_image_url)
+                match = _IMG_URL_RE.search(url)
+                if match:
+                    actual_image_url = unquote(match.group(1))
                     image_name = actual_image_url.split("/")[-1]
                     image_path = os.path.join(Config.OUTPUT_DIR, image_name)
-                    self.browser.screenshot(filename=image_path) #Since using requests is out of the table, a good solution I discovered was using the screenshot method. 
-                    logger.info(f"Image downloaded successfully: {image_name}")
+                    # Stream the body in 64 KiB chunks so peak memory stays bounded
+                    # regardless of image size.
+                    with self._http.stream('GET', actual_image_url) as response:
+                        response.raise_for_status()
+                        with open(image_path, 'wb') as image_file:
+                            for chunk in response.iter_bytes(65536):
+                                image_file.write(chunk)
+                    logger.debug(f"Image downloaded successfully: {image_name}")
                     return image_name
                 else:
                     logger.warning("No valid 'url' parameter found in image URL.")
@@ -152,6 +246,56 @@ class NewsScraper:
             logger.error(f"Error downloading image: {e}")
             return None
 
+    def extract_articles_parallel(self, article_urls, max_concurrency=4):
+        """
+        Fetches multiple article pages concurrently using Playwright.
+
+        Unlike the serial Selenium flow, this opens the pages as tabs of a shared
+        headless browser context so network waits overlap instead of stacking.
+
+        Args:
+            article_urls (list[str]): The URLs of the article pages to fetch.
+            max_concurrency (int): Maximum number of pages open at the same time.
+
+        Returns:
+            list: A list of dictionaries with the scraped fields per article.
+        """
+        logger.info(f"Extracting {len(article_urls)} articles in parallel.")
+        return asyncio.run(self._extract_articles_async(article_urls, max_concurrency))
+
+    async def _extract_articles_async(self, article_urls, max_concurrency):
+        # Imported here so the serial Selenium flow keeps working without Playwright installed.
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=True)
+            context = await browser.new_context()
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def scrape_page(url):
+                async with semaphore:
+                    page = await context.new_page()
+                    try:
+                        await page.goto(url)
+                        title = await page.title()
+                        # Probe with count() first: get_attribute auto-waits, so a page
+                        # without a description meta tag would stall until timeout.
+                        description_meta = page.locator("meta[name='description']")
+                        description = await description_meta.first.get_attribute("content") if await description_meta.count() else None
+                        return {"Title": title, "Description": description or "", "URL": url}
+                    except Exception as e:
+                        # One broken page must not discard the other articles' results.
+                        logger.error(f"Error extracting article {url}: {e}")
+                        return None
+                    finally:
+                        await page.close()
+
+            try:
+                results = await asyncio.gather(*(scrape_page(url) for url in article_urls))
+                return [article for article in results if article is not None]
+            finally:
+                await browser.close()
+
     def check_for_money(self, title, description):
         """
         Checks if the provided text contains any amount of money.
@@ -163,14 +307,11 @@ class NewsScraper:
         Returns:
             bool: True if any amount of money is found, False otherwise.
         """
-        logger.info("Checking for monetary values in the article.")
-        money_patterns = [r"\$\d[\d,]*\.?\d{0,2}", r"\d+ dollars", r"\d+ USD"]
-        text = f"{title} {description}"
-        for pattern in money_patterns:
-            if re.search(pattern, text):
-                logger.info("Monetary value found in the article.")
-                return True
-        logger.info("No monetary values found in the article.")
+        logger.debug("Checking for monetary values in the article.")
+        if _MONEY_RE.search(f"{title} {description}"):
+            logger.debug("Monetary value found in the article.")
+            return True
+        logger.debug("No monetary values found in the article.")
         return False
 
     def save_to_excel(self, articles):
@@ -182,37 +323,87 @@ class NewsScraper:
         """
         logger.info("Saving article data to Excel file.")
         try:
-            excel = Files()
             file_path = os.path.join(Config.OUTPUT_DIR, 'news_data.xlsx')
-            excel.create_workbook(file_path)
-            excel.append_rows_to_worksheet([list(articles[0].keys())])  # Header row
-            for article in articles:
-                excel.append_rows_to_worksheet([list(article.values())])
-            excel.save_workbook()
-            excel.close_workbook()
+            # Emit the sheet XML in one pass with inline strings and package it into the
+            # .xlsx ZIP container directly, avoiding a Python cell object per value.
+            rows = [list(articles[0].keys())] + [list(article.values()) for article in articles]
+            sheet_rows = ''.join(
+                f'<row r="{row_index}">' + ''.join(
+                    f'<c t="inlineStr"><is><t>{escape(str(value))}</t></is></c>' for value in row
+                ) + '</row>'
+                for row_index, row in enumerate(rows, start=1)
+            )
+            sheet_xml = (
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                f'<sheetData>{sheet_rows}</sheetData>'
+                '</worksheet>'
+            )
+            with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr('[Content_Types].xml', _XLSX_CONTENT_TYPES)
+                archive.writestr('_rels/.rels', _XLSX_RELS)
+                archive.writestr('xl/workbook.xml', _XLSX_WORKBOOK)
+                archive.writestr('xl/_rels/workbook.xml.rels', _XLSX_WORKBOOK_RELS)
+                archive.writestr('xl/worksheets/sheet1.xml', sheet_xml)
             logger.info(f"Data saved successfully to {file_path}")
             self.progress_indicator(3, 3)
         except Exception as e:
             logger.error(f"Error saving data to Excel: {e}")
             raise
 
-    def run(self):
+    def start(self):
         """
-        Executes the complete scraping process: opening the site, searching, extracting, and saving data into the excel file.
+        Opens the browser session once so it can be reused across search phrases.
         """
         logger.info("Starting the news scraping process...")
+        self.progress_indicator(1, 3)
+        self.open_site()
+
+    def scrape(self, search_phrase):
+        """
+        Searches and extracts news for a single phrase against the already-open session.
+
+        Args:
+            search_phrase (str): The phrase to search for.
+        """
+        self.search_phrase = search_phrase
+        # Compiled once per phrase; counting then scans each text in one case-insensitive
+        # pass without materializing lowercased copies of title and description.
+        self._phrase_re = re.compile(re.escape(search_phrase), re.IGNORECASE)
+        self.search_news()
+        self.extract_news()
+
+    def stop(self):
+        """
+        Saves the collected articles and releases the browser and HTTP client.
+        """
         try:
-            self.progress_indicator(1, 3)
-            self.open_site()
-            self.search_news()
-            self.extract_news()
-            logger.info("News scraping process completed successfully.")
+            if self.articles:
+                self.save_to_excel(self.articles)
         except Exception as e:
-            logger.error(f"An error occurred during the scraping process: {e}")
+            # Logged rather than re-raised: stop() runs in run()'s finally, and a save
+            # failure must not skip releasing the browser and HTTP client below.
+            logger.error(f"Failed to save articles during shutdown: {e}")
         finally:
             self.browser.close_browser()
+            self._http.close()
             logger.info("Browser closed.")
 
+    def run(self):
+        """
+        Executes the complete scraping process: opening the site, searching each phrase
+        against the same browser session, extracting, and saving data into the excel file.
+        """
+        try:
+            self.start()
+            for phrase in self.search_phrases:
+                self.scrape(phrase)
+            logger.info("News scraping process completed successfully.")
+        except Exception as e:
+            logger.error(f"An error occurred during the scraping process: {e}")
+        finally:
+            self.stop()
+
     def progress_indicator(self, step, total):
         """
         Displays and logs the progress of the scraping process.
@@ -224,10 +415,9 @@ class NewsScraper:
         progress_message = f"Progress: {step}/{total} steps completed."
         logger.info(progress_message)
         print(progress_message)
-        time.sleep(1)
 
 
 if __name__ == "__main__":
-    search_phrase = "ship" 
-    scraper = NewsScraper(search_phrase)
+    search_phrases = ["ship"]
+    scraper = NewsScraper(search_phrases)
     scraper.run()